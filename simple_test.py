@@ -1,5 +1,8 @@
+import logging
 from src.transcript_extractor import YouTubeTranscriptExtractor
 
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
 # Initialize the extractor
 extractor = YouTubeTranscriptExtractor()
 
@@ -1,5 +1,5 @@
 """YouTube Transcript Extractor Package"""
-from .transcript_extractor import YouTubeTranscriptExtractor
+from .transcript_extractor import YouTubeTranscriptExtractor, iter_segments
 from .config import *
 
 __version__ = "1.0.0"
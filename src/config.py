@@ -4,10 +4,21 @@
 DEFAULT_OUTPUT_FORMAT = 'json'
 MAX_VIDEOS_PER_BATCH = 50
 DEFAULT_OUTPUT_DIR = 'output'
+DEFAULT_CACHE_DIR = '.transcript_cache'
 
 # Supported formats
 SUPPORTED_FORMATS = ['json', 'txt', 'csv']
+WRITE_BUFFER_SIZE = 1 << 20
+PRETTY_JSON_MAX_BYTES = 1 << 20
+
+# Processing settings
+CLEAN_TEXT_CACHE_SIZE = 8192
+PIPELINE_QUEUE_SIZE = 8
 
 # API settings
 YOUTUBE_API_TIMEOUT = 30
 RETRY_ATTEMPTS = 3
+MAX_WORKERS = 16
+MAX_CONCURRENT_REQUESTS = 32
+HTTP_POOL_CONNECTIONS = 16
+TRANSCRIPT_LANGUAGES = ['en']
@@ -3,133 +3,484 @@ YouTube Transcript Extractor
 AI-powered transcript extraction for ministry and business use
 """
 
+import asyncio
+import bisect
+import itertools
 import json
 import csv
+import functools
 import os
 import logging
+import queue
 import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import List, Dict, Optional, Union
 import requests
-from youtube_transcript_api import YouTubeTranscriptApi
-import pandas as pd
+from requests.adapters import HTTPAdapter
+# get_transcript opens a new session per call; the fetcher lets us pass a shared one
+from youtube_transcript_api._transcripts import TranscriptListFetcher
 from .config import *
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Matches youtube.com/watch?v=, youtube.com/embed/ and youtu.be/ links in one pass
+_VIDEO_ID_RE = re.compile(r'(?:youtube\.com/(?:watch\?v=|embed/)|youtu\.be/)([^&\n?#]+)')
+
+# Bracketed/parenthesised annotations such as [Music] or (laughs)
+_ANNOTATION_RE = re.compile(r'\[[^\]]*\]|\([^)]*\)')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+# Marks the end of the stream on the pipeline queues
+_PIPELINE_DONE = object()
+# How often blocked pipeline stages check whether the pipeline was stopped
+_PIPELINE_POLL_SECONDS = 0.1
+
+
+def _json_dumps(obj, indent: Optional[int] = 2) -> bytes:
+    """Serialize obj to UTF-8 JSON, using orjson when available"""
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    separators = (',', ':') if indent is None else None
+    return json.dumps(obj, indent=indent, separators=separators, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(data: bytes):
+    """Parse UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def iter_segments(transcript: Dict):
+    """Yield per-segment dicts from a transcript, whether stored as columns or as 'segments'"""
+    if 'starts' not in transcript:
+        yield from transcript.get('segments', ())
+        return
+    for start, duration, text in zip(transcript['starts'], transcript['durations'], transcript['texts']):
+        yield {'start': start, 'duration': duration, 'text': text}
+
+
+def _with_segments(data: Dict) -> Dict:
+    """Return a result in the saved schema, folding the segment columns back into 'segments'"""
+    if 'starts' not in data:
+        return data
+    saved = {}
+    for key, value in data.items():
+        if key == 'starts':
+            saved['segments'] = list(iter_segments(data))
+        elif key not in ('durations', 'texts'):
+            saved[key] = value
+    return saved
+
+
+def _write_json_object(f, transcripts: Dict, indent: Optional[int]):
+    """Write transcripts as one JSON object, serializing a single video at a time
+
+    Produces the same bytes as dumping the whole dict, but only one video's
+    per-segment dicts exist at any moment.
+    """
+    if not transcripts:
+        f.write(b'{}')
+        return
+    
+    # Nested lines of each value are shifted one level to sit inside the outer object
+    newline = b'\n' + b' ' * indent if indent is not None else None
+    separator = b': ' if indent is not None else b':'
+    
+    f.write(b'{')
+    for i, (video_id, data) in enumerate(transcripts.items()):
+        if i:
+            f.write(b',')
+        value = _json_dumps(_with_segments(data), indent=indent)
+        if newline is not None:
+            f.write(newline)
+            value = value.replace(b'\n', newline)
+        f.write(_json_dumps(video_id, indent=None) + separator + value)
+    f.write(b'\n}' if newline is not None else b'}')
+
+
+def _iter_csv_rows(transcripts: Dict):
+    """Yield one CSV row per segment of every successful transcript"""
+    for video_id, data in transcripts.items():
+        if data.get('status') != 'success':
+            continue
+        if 'starts' in data:
+            for start, duration, text in zip(data['starts'], data['durations'], data['texts']):
+                yield (video_id, start, duration, text)
+        else:
+            # Results reloaded from saved JSON carry per-segment dicts instead of columns
+            for segment in data.get('segments', ()):
+                yield (video_id, segment['start'], segment['duration'], segment['text'])
+
+
 class YouTubeTranscriptExtractor:
     """Extract and process YouTube video transcripts for AI training and content analysis"""
     
-    def __init__(self, output_dir: str = DEFAULT_OUTPUT_DIR):
+    def __init__(self, output_dir: str = DEFAULT_OUTPUT_DIR, max_workers: int = MAX_WORKERS,
+                 cache_dir: Optional[str] = DEFAULT_CACHE_DIR, cache_ttl: Optional[float] = None):
         self.output_dir = output_dir
-        self.setup_logging()
+        self.max_workers = max_workers
+        # Successful results are cached per video; cache_dir=None disables the cache
+        # and cache_ttl (seconds) expires entries by file age
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        
+        # One pooled session so every video reuses keep-alive connections to YouTube
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=max(max_workers, MAX_CONCURRENT_REQUESTS)
+        ))
         self.ensure_output_directory()
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+    
+    def close(self):
+        """Close the pooled HTTP session and its connections"""
+        self._session.close()
+    
+    def __enter__(self):
+        return self
     
-    def setup_logging(self):
-        """Configure logging for the extractor"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
-        self.logger = logging.getLogger(__name__)
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def ensure_output_directory(self):
         """Create output directory if it doesn't exist"""
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        os.makedirs(self.output_dir, exist_ok=True)
     
     def extract_video_id(self, url: str) -> Optional[str]:
         """Extract video ID from various YouTube URL formats"""
-        patterns = [
-            r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([^&\n?#]+)',
-            r'(?:https?://)?(?:www\.)?youtu\.be/([^&\n?#]+)',
-            r'(?:https?://)?(?:www\.)?youtube\.com/embed/([^&\n?#]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        match = _VIDEO_ID_RE.search(url)
+        return match.group(1) if match else None
     
-    def clean_transcript_text(self, text: str) -> str:
+    def extract_video_ids(self, urls: List[str]) -> List[Optional[str]]:
+        """Extract video IDs from many URLs, in order"""
+        # A precompiled search per URL beats one scan over a joined buffer: mapping
+        # matches back to URL indexes costs more than the per-call overhead it saves
+        search = _VIDEO_ID_RE.search
+        video_ids = []
+        for url in urls:
+            match = search(url)
+            video_ids.append(match.group(1) if match else None)
+        return video_ids
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=CLEAN_TEXT_CACHE_SIZE)
+    def clean_transcript_text(text: str) -> str:
         """Clean transcript text for AI training"""
-        # Remove content in brackets/parentheses
-        text = re.sub(r'\[.*?\]', '', text)
-        text = re.sub(r'\(.*?\)', '', text)
+        # Fast path: printable ASCII has no whitespace besides ' ', so with no
+        # brackets and no double spaces the regexes below would change nothing
+        if text.isascii() and text.isprintable() and '[' not in text and '(' not in text and '  ' not in text:
+            return text.strip()
         
-        # Clean up spacing and newlines
-        text = re.sub(r'\n+', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
+        # Remove content in brackets/parentheses, then collapse spacing and newlines
+        return _WHITESPACE_RE.sub(' ', _ANNOTATION_RE.sub('', text)).strip()
+    
+    def _process_transcript(self, video_id: str, transcript_list: List[Dict]) -> Dict:
+        """Clean a raw transcript and build its result record"""
+        # Segments are stored column-wise: parallel start/duration/text lists
+        segment_count = len(transcript_list)
+        starts = [None] * segment_count
+        durations = [None] * segment_count
+        texts = [None] * segment_count
         
-        return text.strip()
+        for i, entry in enumerate(transcript_list):
+            starts[i] = entry['start']
+            durations[i] = entry.get('duration', 0)
+            texts[i] = self.clean_transcript_text(entry['text'])
+        
+        return {
+            'video_id': video_id,
+            'full_text': ' '.join(texts).strip(),
+            'starts': starts,
+            'durations': durations,
+            'texts': texts,
+            'total_segments': segment_count,
+            'status': 'success'
+        }
+    
+    def _failed_result(self, video_id: str, error: Exception) -> Dict:
+        """Log a failed extraction and build its result record"""
+        logger.error(f"Failed to extract transcript for {video_id}: {str(error)}")
+        return {
+            'video_id': video_id,
+            'error': str(error),
+            'status': 'failed'
+        }
+    
+    def _cache_path(self, video_id: str) -> Optional[str]:
+        """Path of the cache file for video_id, or None if it can't be cached"""
+        if self.cache_dir is None or not video_id.replace('-', '').replace('_', '').isalnum():
+            return None
+        return os.path.join(self.cache_dir, f"{video_id}.json")
+    
+    def _load_cached(self, video_id: str) -> Optional[Dict]:
+        """Return the cached result for video_id if present and not expired"""
+        path = self._cache_path(video_id)
+        if path is None:
+            return None
+        try:
+            if self.cache_ttl is not None and time.time() - os.path.getmtime(path) > self.cache_ttl:
+                return None
+            with open(path, 'rb') as f:
+                result = _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        
+        logger.info(f"Loaded cached transcript for video: {video_id}")
+        return result
+    
+    def _store_cached(self, result: Dict):
+        """Atomically write a successful result to the cache"""
+        path = self._cache_path(result['video_id'])
+        if path is None:
+            return
+        # A failed cache write must never fail the extraction itself
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_json_dumps(result, indent=None))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not cache transcript for {result['video_id']}: {str(e)}")
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+    
+    def _fetch_transcript(self, video_id: str) -> List[Dict]:
+        """Download the raw transcript for a video over the shared session"""
+        transcript_list = TranscriptListFetcher(self._session).fetch(video_id)
+        return transcript_list.find_transcript(TRANSCRIPT_LANGUAGES).fetch()
     
     def extract_single_transcript(self, video_id: str) -> Optional[Dict]:
         """Extract transcript from a single video"""
+        cached = self._load_cached(video_id)
+        if cached is not None:
+            return cached
+        
         try:
-            self.logger.info(f"Extracting transcript for video: {video_id}")
+            logger.info(f"Extracting transcript for video: {video_id}")
             
             # Get transcript
-            transcript_list = YouTubeTranscriptApi.get_transcript(video_id)
-            
-            # Process transcript
-            full_text = ""
-            processed_segments = []
-            
-            for entry in transcript_list:
-                cleaned_text = self.clean_transcript_text(entry['text'])
-                full_text += cleaned_text + " "
-                
-                processed_segments.append({
-                    'start': entry['start'],
-                    'duration': entry.get('duration', 0),
-                    'text': cleaned_text
-                })
+            transcript_list = self._fetch_transcript(video_id)
             
-            return {
-                'video_id': video_id,
-                'full_text': full_text.strip(),
-                'segments': processed_segments,
-                'total_segments': len(processed_segments),
-                'status': 'success'
-            }
+            result = self._process_transcript(video_id, transcript_list)
             
         except Exception as e:
-            self.logger.error(f"Failed to extract transcript for {video_id}: {str(e)}")
-            return {
-                'video_id': video_id,
-                'error': str(e),
-                'status': 'failed'
-            }
+            return self._failed_result(video_id, e)
+        
+        self._store_cached(result)
+        return result
     
     def extract_transcripts(self, urls: List[str]) -> Dict[str, Dict]:
-        """Extract transcripts from multiple YouTube URLs"""
+        """Extract transcripts from multiple YouTube URLs concurrently"""
         results = {}
+        if not urls:
+            return results
         
-        for url in urls:
-            video_id = self.extract_video_id(url)
-            if video_id:
-                result = self.extract_single_transcript(video_id)
-                results[video_id] = result
+        # Fetching is network-bound, so threads overlap the per-video latency
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as executor:
+            futures = []
+            for url in urls:
+                video_id = self.extract_video_id(url)
+                if video_id:
+                    futures.append((video_id, executor.submit(self.extract_single_transcript, video_id)))
+                else:
+                    logger.warning(f"Could not extract video ID from URL: {url}")
+                    futures.append((url, None))
+            
+            # Collect in submission order so output follows the input URL order
+            for key, future in futures:
+                if future is not None:
+                    results[key] = future.result()
+                else:
+                    results[key] = {
+                        'error': 'Invalid YouTube URL',
+                        'status': 'failed'
+                    }
+        
+        return results
+    
+    async def extract_transcripts_async(self, urls: List[str]) -> Dict[str, Dict]:
+        """Extract transcripts from multiple YouTube URLs inside an asyncio event loop"""
+        loop = asyncio.get_running_loop()
+        
+        # A dedicated pool makes MAX_CONCURRENT_REQUESTS the real limit; the loop's
+        # default executor is sized from the CPU count instead
+        executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+        try:
+            keys = []
+            tasks = []
+            for url in urls:
+                video_id = self.extract_video_id(url)
+                if video_id:
+                    keys.append(video_id)
+                    tasks.append(loop.run_in_executor(executor, self.extract_single_transcript, video_id))
+                else:
+                    logger.warning(f"Could not extract video ID from URL: {url}")
+                    keys.append(url)
+                    tasks.append(None)
+            
+            fetched = iter(await asyncio.gather(*(task for task in tasks if task is not None)))
+        finally:
+            # Never wait on in-flight fetches here: that would block the event loop on cancellation
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        results = {}
+        for key, task in zip(keys, tasks):
+            if task is not None:
+                results[key] = next(fetched)
             else:
-                self.logger.warning(f"Could not extract video ID from URL: {url}")
-                results[url] = {
+                results[key] = {
                     'error': 'Invalid YouTube URL',
                     'status': 'failed'
                 }
         
         return results
     
-    def save_transcripts(self, transcripts: Dict, format: str = 'json', filename: str = 'transcripts'):
-        """Save transcripts in specified format"""
+    def extract_and_save_stream(self, urls: List[str], filename: str = 'transcripts') -> str:
+        """Fetch, clean and save transcripts as a pipeline, writing one JSON object per line"""
+        filepath = os.path.join(self.output_dir, f"{filename}.jsonl")
+        
+        # Bounded queues apply back-pressure so fetching can't run far ahead of writing
+        fetch_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        write_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        # Set when any stage fails so the others stop instead of blocking on the queues
+        stop = threading.Event()
+        errors = []
+        
+        def put(q, item):
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=_PIPELINE_POLL_SECONDS)
+                    return
+                except queue.Full:
+                    pass
+        
+        def get(q):
+            while not stop.is_set():
+                try:
+                    return q.get(timeout=_PIPELINE_POLL_SECONDS)
+                except queue.Empty:
+                    pass
+            return _PIPELINE_DONE
+        
+        def fetch_stage():
+            try:
+                for url in urls:
+                    video_id = self.extract_video_id(url)
+                    if stop.is_set():
+                        break
+                    
+                    if not video_id:
+                        logger.warning(f"Could not extract video ID from URL: {url}")
+                        put(fetch_queue, (url, None, {
+                            'url': url,
+                            'error': 'Invalid YouTube URL',
+                            'status': 'failed'
+                        }))
+                        continue
+                    
+                    cached = self._load_cached(video_id)
+                    if cached is not None:
+                        put(fetch_queue, (video_id, None, cached))
+                        continue
+                    
+                    try:
+                        logger.info(f"Extracting transcript for video: {video_id}")
+                        transcript_list = self._fetch_transcript(video_id)
+                        put(fetch_queue, (video_id, transcript_list, None))
+                    except Exception as e:
+                        put(fetch_queue, (video_id, None, self._failed_result(video_id, e)))
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                put(fetch_queue, _PIPELINE_DONE)
+        
+        def clean_stage():
+            try:
+                for video_id, transcript_list, result in iter(lambda: get(fetch_queue), _PIPELINE_DONE):
+                    if result is None:
+                        try:
+                            result = self._process_transcript(video_id, transcript_list)
+                        except Exception as e:
+                            result = self._failed_result(video_id, e)
+                        else:
+                            self._store_cached(result)
+                    put(write_queue, result)
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                put(write_queue, _PIPELINE_DONE)
+        
+        stages = [
+            threading.Thread(target=fetch_stage, daemon=True),
+            threading.Thread(target=clean_stage, daemon=True)
+        ]
+        
+        # Open the output before starting any stage so a bad path fails fast
+        with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            for stage in stages:
+                stage.start()
+            
+            # Write stage runs on the calling thread
+            try:
+                for result in iter(lambda: get(write_queue), _PIPELINE_DONE):
+                    f.write(_json_dumps(_with_segments(result), indent=None) + b'\n')
+            except BaseException:
+                stop.set()
+                raise
+            finally:
+                for stage in stages:
+                    stage.join()
+        
+        if errors:
+            raise errors[0]
+        
+        logger.info(f"Transcripts saved to: {filepath}")
+        return filepath
+    
+    def save_transcripts(self, transcripts: Dict, format: str = 'json', filename: str = 'transcripts',
+                         indent: Optional[int] = None):
+        """Save transcripts in specified format; JSON is compact unless indent is given"""
         if format not in SUPPORTED_FORMATS:
             raise ValueError(f"Unsupported format: {format}. Use one of {SUPPORTED_FORMATS}")
         
         filepath = os.path.join(self.output_dir, f"{filename}.{format}")
         
         if format == 'json':
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(transcripts, f, indent=2, ensure_ascii=False)
+            # Pretty-printing large payloads costs more than it helps, so judge by
+            # the first video and fall back to compact output when it is too big
+            if indent is not None and transcripts:
+                first = _with_segments(next(iter(transcripts.values())))
+                if len(_json_dumps(first, indent=None)) > PRETTY_JSON_MAX_BYTES:
+                    logger.info("Transcripts too large to pretty-print, writing compact JSON")
+                    indent = None
+                del first
+            
+            with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                _write_json_object(f, transcripts, indent)
         
         elif format == 'txt':
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with open(filepath, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
                 for video_id, data in transcripts.items():
                     if data.get('status') == 'success':
                         f.write(f"Video ID: {video_id}\n")
@@ -137,73 +488,86 @@ class YouTubeTranscriptExtractor:
                         f.write("-" * 80 + "\n\n")
         
         elif format == 'csv':
-            rows = []
-            for video_id, data in transcripts.items():
-                if data.get('status') == 'success':
-                    for segment in data.get('segments', []):
-                        rows.append({
-                            'video_id': video_id,
-                            'start_time': segment['start'],
-                            'duration': segment['duration'],
-                            'text': segment['text']
-                        })
-            
-            df = pd.DataFrame(rows)
-            df.to_csv(filepath, index=False, encoding='utf-8')
+            with open(filepath, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
+                # pandas wrote '\n' line endings; keep them rather than the csv module's '\r\n'
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow(['video_id', 'start_time', 'duration', 'text'])
+                writer.writerows(_iter_csv_rows(transcripts))
         
-        self.logger.info(f"Transcripts saved to: {filepath}")
+        logger.info(f"Transcripts saved to: {filepath}")
         return filepath
 
 
 class AITrainingDataPreparer:
     """Prepare transcript data specifically for AI training"""
     
-    def __init__(self, max_chunk_length: int = 512):
+    def __init__(self, max_chunk_length: int = 512, stride: Optional[int] = None):
+        if stride is not None and stride <= 0:
+            raise ValueError(f"stride must be positive, got {stride}")
         self.max_chunk_length = max_chunk_length
+        # Characters to advance between chunk starts; None gives non-overlapping chunks.
+        # A stride of about 0.75 * max_chunk_length keeps context across chunk boundaries.
+        self.stride = stride
     
     def chunk_text(self, text: str) -> List[str]:
         """Split text into chunks suitable for AI training"""
         words = text.split()
+        # offsets[i] counts the characters in words[:i], each followed by one space
+        offsets = [0, *itertools.accumulate(len(word) + 1 for word in words)]
         chunks = []
-        current_chunk = []
-        current_length = 0
         
-        for word in words:
-            if current_length + len(word) + 1 <= self.max_chunk_length:
-                current_chunk.append(word)
-                current_length += len(word) + 1
+        start = 0
+        while start < len(words):
+            # Furthest end whose joined chunk still fits, but always take at least one word
+            limit = offsets[start] + self.max_chunk_length + 1
+            end = max(bisect.bisect_right(offsets, limit) - 1, start + 1)
+            chunks.append(' '.join(words[start:end]))
+            if end == len(words):
+                break
+            
+            if self.stride is None:
+                start = end
             else:
-                if current_chunk:
-                    chunks.append(' '.join(current_chunk))
-                current_chunk = [word]
-                current_length = len(word)
-        
-        if current_chunk:
-            chunks.append(' '.join(current_chunk))
+                # Next chunk starts at the first word at least `stride` characters further on,
+                # but never past this chunk's end so no word is skipped
+                next_start = bisect.bisect_left(offsets, offsets[start] + self.stride)
+                start = min(max(next_start, start + 1), end)
         
         return chunks
     
-    def prepare_for_training(self, transcripts: Dict) -> List[Dict]:
-        """Prepare transcripts for AI training"""
-        training_data = []
+    def prepare_for_training(self, transcripts: Dict, max_workers: Optional[int] = None) -> List[Dict]:
+        """Prepare transcripts for AI training; max_workers > 1 chunks videos in parallel processes"""
+        video_ids = [video_id for video_id, data in transcripts.items() if data.get('status') == 'success']
+        texts = [transcripts[video_id]['full_text'] for video_id in video_ids]
         
-        for video_id, data in transcripts.items():
-            if data.get('status') == 'success':
-                text_chunks = self.chunk_text(data['full_text'])
-                
-                for i, chunk in enumerate(text_chunks):
-                    training_data.append({
-                        'video_id': video_id,
-                        'chunk_id': i,
-                        'text': chunk,
-                        'chunk_length': len(chunk)
-                    })
+        # Chunking a video takes milliseconds, so a process pool only pays off for very
+        # large batches; callers opt in (and need a __main__ guard on spawn platforms)
+        if max_workers is not None and max_workers > 1 and len(texts) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                all_chunks = list(executor.map(self.chunk_text, texts))
+        else:
+            all_chunks = [self.chunk_text(text) for text in texts]
+        
+        training_data = []
+        for video_id, text_chunks in zip(video_ids, all_chunks):
+            for i, chunk in enumerate(text_chunks):
+                training_data.append({
+                    'video_id': video_id,
+                    'chunk_id': i,
+                    'text': chunk,
+                    'chunk_length': len(chunk)
+                })
         
         return training_data
 
 
 # Example usage for ministry and business
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    
     # Initialize extractor
     extractor = YouTubeTranscriptExtractor()
     